@@ -1,6 +1,12 @@
 OUTPUT_FILE = "output.txt"
 CACHE_FOLDER = "data/compact_cache"
+CACHE_GENERATION_FILE = ".generation"
 ARCHIVE_FOLDER = "data/compact_archive"
+INCREMENTAL_STATE_FOLDER = "data/incremental_state"
+MANUAL_ANALYSIS_FOLDER = "manualanalysis"
+RESULTS_FILE = "data/results.json"
+SCHEDULE_FILE = "data/schedule.json"
+DAILY_CREDIT_BUDGET = 50
 CONFIG_FILE = "config.json"
 ALL_POSSIBLE_LEAGUES_FILE = "all_possible_leagues.json"
 LEAGUE_NAMES = {
@@ -0,0 +1,31 @@
+# Released under the MIT-0 License. Do whatever you want. No warranty.
+
+import argparse
+from constants import ARCHIVE_FOLDER, MANUAL_ANALYSIS_FOLDER, RESULTS_FILE
+from utils.logging_config import setup_logging
+from utils.results import build_match_id_index, ingest_folder, save_results, evaluate_picks
+
+
+logger = setup_logging()
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest manualanalysis results and picks into a results table keyed by match id.")
+    parser.add_argument("--folder", default=MANUAL_ANALYSIS_FOLDER, help="Folder with *_res.txt, *_odd.txt and per-model files.")
+    parser.add_argument("--archive", default=ARCHIVE_FOLDER, help="Compact archive used to resolve match ids.")
+    parser.add_argument("--output", default=RESULTS_FILE, help="Results table to create or update.")
+    parser.add_argument("--window", type=int, default=1, help="Days around the analysis date to look for the kickoff.")
+    args = parser.parse_args()
+
+    index = build_match_id_index(args.archive)
+    rows, unresolved = ingest_folder(args.folder, index, window_days=args.window)
+    for source, displays in unresolved.items():
+        for display in displays:
+            logger.warning("Unresolved match in %s: %s", source, display)
+
+    results = save_results(rows, args.output)
+
+    for model, (correct, total) in evaluate_picks(results).items():
+        print(f"{model:<10} {correct:>5}/{total:<5} {correct / total:.1%}")
+
+if __name__ == '__main__':
+    main()
@@ -7,8 +7,9 @@ from constants import *
 from utils.logging_config import setup_logging
 from utils.match_processing import compute_predictability, get_matches_sorted, decide_action, print_match
 from utils.file_operations import create_tip_file
-from utils.cache import fetch_api_response_with_cache, get_cached_api_response
+from utils.cache import fetch_api_response_with_cache, get_cached_api_response, mark_cache_generation
 from utils.config import load_config, build_config_from_api
+from utils.incremental import refresh_incremental
 
 
 logger = setup_logging()
@@ -23,6 +24,7 @@ def main():
     parser.add_argument("--basketball", action="store_true", help="Parse only basketball leagues.")
     parser.add_argument("--hockey", action="store_true", help="Parse only hockey leagues.")
     parser.add_argument("--days", type=int, default=None, help="Number of days to fetch matches for.")
+    parser.add_argument("--incremental", action="store_true", help="Only re-render and rewrite tip files for matches whose odds or decision changed.")
     args = parser.parse_args()
 
     build_config_from_api(os.getenv("THE_ODDS_API_KEY"))
@@ -47,6 +49,19 @@ def main():
     nr_zile = args.days if args.days is not None else config.get("default_days", 1)
     number_of_matches = config.get("number_of_matches", 5)
 
+    if args.incremental:
+        refresh_incremental(
+            leagues,
+            actualSport,
+            nr_zile,
+            number_of_matches,
+            OUTPUT_FILE,
+            get_api_data=fetch_api_response_with_cache,
+            get_cached_data=get_cached_api_response
+        )
+        mark_cache_generation()
+        return
+
     predictable_matches = get_matches_sorted(
         by="predictability",
         nr_zile=nr_zile,
@@ -55,6 +70,8 @@ def main():
         get_api_data=fetch_api_response_with_cache,
         get_cached_data=get_cached_api_response
     )
+    # Every league has been fetched (or read from cache) at this point
+    mark_cache_generation()
     if not predictable_matches:
         logger.info("No matches found for the specified interval or data is unavailable.")
         return
@@ -1,9 +1,14 @@
 #!/bin/bash
 
-# Clean up previous runs
-rm -rf ponturi/football
-rm output.txt
+if [[ -n "$INCREMENTAL" ]]; then
+  # Keep previous tip files and output; only changed matches are rewritten
+  python3 main.py --football --incremental
+else
+  # Clean up previous runs
+  rm -rf ponturi/football
+  rm output.txt
 
-python3 main.py --football
+  python3 main.py --football
+fi
 
-./extract_safe_bets.sh output.txt filtered_football_output.txt football $1
\ No newline at end of file
+./extract_safe_bets.sh output.txt filtered_football_output.txt football $1
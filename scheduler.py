@@ -0,0 +1,72 @@
+# Released under the MIT-0 License. Do whatever you want. No warranty.
+
+import os
+import time
+import argparse
+from dotenv import load_dotenv
+from constants import CONFIG_FILE, OUTPUT_FILE, SCHEDULE_FILE, DAILY_CREDIT_BUDGET
+from utils.logging_config import setup_logging
+from utils.cache import fetch_api_response_with_cache, load_cache_file, mark_cache_generation
+from utils.config import load_config
+from utils.incremental import refresh_incremental
+from utils.scheduler import load_schedule, save_schedule, run_cycle, next_wakeup, utc_now
+
+
+logger = setup_logging()
+load_dotenv(override=True)
+
+# Never sleep less than this between cycles, even if a refresh is already overdue
+MIN_SLEEP_SECONDS = 60
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh leagues adaptively, more often close to kickoff.")
+    parser.add_argument("--sport", choices=["football", "basketball", "hockey"], default="football", help="Sport whose leagues are scheduled.")
+    parser.add_argument("--budget", type=int, default=DAILY_CREDIT_BUDGET, help="Maximum API credits (league fetches) per 24 hours.")
+    parser.add_argument("--schedule-file", default=SCHEDULE_FILE, help="Where the schedule is persisted across restarts.")
+    parser.add_argument("--days", type=int, default=None, help="Number of days to render matches for.")
+    parser.add_argument("--once", action="store_true", help="Run a single fetch cycle and exit (e.g. from cron).")
+    args = parser.parse_args()
+
+    if not os.getenv("THE_ODDS_API_KEY"):
+        logger.error("API key is missing. Set THE_ODDS_API_KEY in your environment.")
+        return
+
+    while True:
+        config = load_config(CONFIG_FILE)
+        leagues = config.get(args.sport, [])
+        nr_zile = args.days if args.days is not None else config.get("default_days", 1)
+        number_of_matches = config.get("number_of_matches", 5)
+
+        schedule = load_schedule(args.schedule_file)
+        fetched = run_cycle(
+            schedule,
+            leagues,
+            args.budget,
+            fetch_league=lambda league: fetch_api_response_with_cache(league, force=True),
+            load_league=load_cache_file
+        )
+        save_schedule(schedule, args.schedule_file)
+
+        if fetched:
+            mark_cache_generation()
+            # Re-render from the cache only; leagues that were not due are not fetched again
+            refresh_incremental(
+                leagues,
+                args.sport,
+                nr_zile,
+                number_of_matches,
+                OUTPUT_FILE,
+                get_api_data=lambda league: None,
+                get_cached_data=load_cache_file
+            )
+
+        if args.once:
+            return
+
+        wakeup = next_wakeup(schedule, leagues, args.budget)
+        sleep_seconds = max((wakeup - utc_now()).total_seconds(), MIN_SLEEP_SECONDS)
+        logger.info("Next fetch cycle at %s (in %.0f seconds)", wakeup.isoformat(), sleep_seconds)
+        time.sleep(sleep_seconds)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+# Released under the MIT-0 License. Do whatever you want. No warranty.
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from constants import CACHE_FOLDER
+from utils.logging_config import setup_logging
+from utils.cache import read_cache_generation
+from utils.index import IndexHolder, build_index_from_cache
+
+
+logger = setup_logging()
+
+PUBLIC_FIELDS = ("id", "league", "sport", "team1", "team2", "odds", "commence_time", "predictability", "action")
+
+
+def refresh_loop(holder, cache_folder, interval, threshold, stop_event):
+    """
+    Rebuilds the index whenever a refresh marks a new cache generation and swaps it in.
+    A failed rebuild keeps the old index and is retried on the next check.
+    """
+    last_generation = object()  # Always build once at startup, marker or not
+    while not stop_event.is_set():
+        generation = read_cache_generation(cache_folder)
+        if generation != last_generation:
+            try:
+                holder.swap(build_index_from_cache(cache_folder, threshold=threshold))
+                last_generation = generation
+            except Exception as e:
+                logger.error("Failed to rebuild match index, keeping the previous one: %s", e)
+        stop_event.wait(interval)
+
+
+def make_handler(holder):
+    class QueryHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == "/health":
+                index = holder.current
+                return self.send_json(200, {"matches": index.size, "built_at": index.built_at})
+            if url.path != "/matches":
+                return self.send_json(404, {"error": "Unknown endpoint. Use /matches or /health."})
+
+            params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            try:
+                hours = float(params["hours"]) if "hours" in params else None
+                top_n = int(params.get("top", -1))
+            except ValueError as e:
+                return self.send_json(400, {"error": f"Invalid query parameter: {e}"})
+            by = params.get("sort", "predictability")
+            if by not in ("predictability", "commence_time"):
+                return self.send_json(400, {"error": "sort must be 'predictability' or 'commence_time'."})
+
+            # Grab the snapshot once so the whole request sees a single index
+            index = holder.current
+            start = time.perf_counter()
+            matches = index.query(
+                sport=params.get("sport"),
+                league=params.get("league"),
+                hours=hours,
+                safe_only=params.get("safe", "0").lower() in ("1", "true", "yes"),
+                top_n=top_n,
+                by=by
+            )
+            elapsed_us = (time.perf_counter() - start) * 1e6
+            self.send_json(200, {
+                "built_at": index.built_at,
+                "query_us": round(elapsed_us, 1),
+                "matches": [{k: m.get(k) for k in PUBLIC_FIELDS} for m in matches]
+            })
+
+        def send_json(self, status, payload):
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug("%s - %s", self.address_string(), format % args)
+
+    return QueryHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve precomputed match rankings from the compact cache.")
+    parser.add_argument("--host", default="0.0.0.0", help="Address to bind to.")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on.")
+    parser.add_argument("--cache-folder", default=CACHE_FOLDER, help="Compact cache folder to index.")
+    parser.add_argument("--interval", type=float, default=30, help="Seconds between cache change checks.")
+    parser.add_argument("--threshold", type=float, default=1.0, help="Predictability threshold for safe bets.")
+    args = parser.parse_args()
+
+    holder = IndexHolder()
+    stop_event = threading.Event()
+    refresher = threading.Thread(
+        target=refresh_loop,
+        args=(holder, args.cache_folder, args.interval, args.threshold, stop_event),
+        daemon=True
+    )
+    refresher.start()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(holder))
+    logger.info("Serving match index on %s:%d", args.host, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_event.set()
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
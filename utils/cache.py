@@ -1,9 +1,11 @@
 import os
 import json
+import time
 import datetime
 import logging
 from constants import CACHE_FOLDER
 from constants import ARCHIVE_FOLDER
+from constants import CACHE_GENERATION_FILE
 from utils.api import fetch_api_response
 from utils.transform import to_compact_matches
 
@@ -47,12 +49,41 @@ def save_to_cache(league, data, cache_folder):
     cache_file = os.path.join(cache_folder, f"api_response_{league}.json")
     try:
         os.makedirs(cache_folder, exist_ok=True)  # Ensure the cache folder exists
-        with open(cache_file, 'w') as f:
+        # Write to a temp file and swap it in, so readers never see a half-written file
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, 'w') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
         logger.info("Data cached for league %s: %s", league, cache_file)
     except Exception as e:
         logger.error("Error saving data to cache for league %s: %s", league, e)
 
+def mark_cache_generation(cache_folder=CACHE_FOLDER):
+    """
+    Marks the end of a refresh by atomically replacing the generation file in the cache folder.
+    Readers (serve mode) only reload the cache when this marker changes, never mid-refresh.
+    """
+    marker_file = os.path.join(cache_folder, CACHE_GENERATION_FILE)
+    try:
+        os.makedirs(cache_folder, exist_ok=True)
+        tmp_file = marker_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            f.write(str(time.time_ns()))
+        os.replace(tmp_file, marker_file)
+        logger.info("Cache generation marked: %s", marker_file)
+    except Exception as e:
+        logger.error("Error marking cache generation %s: %s", marker_file, e)
+
+def read_cache_generation(cache_folder=CACHE_FOLDER):
+    """
+    Returns the current cache generation, or None if no refresh has been marked yet.
+    """
+    try:
+        with open(os.path.join(cache_folder, CACHE_GENERATION_FILE), 'r') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
 def load_json(file_path):
     """
     Loads JSON data from a file. Returns an empty list if the file doesn't exist.
@@ -93,9 +124,20 @@ def get_sport_folder(league):
         logger.error("Unknown sport for league %s", league)
         return None
 
-def fetch_api_response_with_cache(league):
+def load_cache_file(league):
+    """
+    Loads the compact cache file of a league regardless of its age.
+    Returns an empty list if there is no cache for the league.
+    """
+    sport_folder = get_sport_folder(league)
+    if not sport_folder:
+        return []
+    return load_json(os.path.join(CACHE_FOLDER, sport_folder, f"api_response_{league}.json"))
+
+def fetch_api_response_with_cache(league, force=False):
     """
     Fetches API response for a league, using cache if available.
+    With force=True the cache is bypassed and the API is always called.
     """
     api_key = os.getenv("THE_ODDS_API_KEY")
     if not api_key:
@@ -113,9 +155,10 @@ def fetch_api_response_with_cache(league):
     os.makedirs(archive_folder, exist_ok=True)  # Ensure the sport-specific folder exists
 
     # Check cache first
-    cached_data = get_cached_api_response(league)
-    if cached_data:
-        return cached_data
+    if not force:
+        cached_data = get_cached_api_response(league)
+        if cached_data:
+            return cached_data
 
     cache_file = os.path.join(archive_folder, f"api_response_{league}.json")
     # Load existing cache data
@@ -123,6 +166,9 @@ def fetch_api_response_with_cache(league):
 
     # Fetch raw data from the API
     raw_data = fetch_api_response(league, api_key)
+    if raw_data is None:
+        # Keep the existing cache instead of overwriting it with an empty list
+        return None
 
     # Transform raw → compact
     new_data = to_compact_matches(raw_data)
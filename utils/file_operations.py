@@ -16,16 +16,30 @@ def get_template_from_sport(sport):
     }
     return templates.get(sport, "prompt-examples/gpt-generated-5x3.txt")
 
+def get_ponturi_folder(sport):
+    # Get the absolute path for the ponturi folder
+    base_dir = os.path.dirname(os.path.abspath(__file__))  # Get the directory of this script
+    return os.path.join(base_dir, "..", "ponturi", sport)  # Navigate to the parent directory and create "ponturi"
+
+def get_tip_file_path(match, sport):
+    sanitized_team1 = sanitize_filename(match['team1'])
+    sanitized_team2 = sanitize_filename(match['team2'])
+    filename = f"tip_{sanitized_team1}_vs_{sanitized_team2}.txt"
+    return os.path.join(get_ponturi_folder(sport), filename)
+
 def create_tip_file(match, action, sport):
+    """
+    Writes the read-only tip file for a "Pariu sigur" match.
+    Returns the path of the tip file, or None if nothing was written.
+    """
     if action.lower() != "pariu sigur":
-        return
+        return None
     template_file = get_template_from_sport(sport)
-    # Get the absolute path for the ponturi folder
-    base_dir = os.path.dirname(os.path.abspath(__file__))  # Get the directory of this script
-    ponturi_folder = os.path.join(base_dir, "..", "ponturi", sport)  # Navigate to the parent directory and create "ponturi"
+    ponturi_folder = get_ponturi_folder(sport)
     os.makedirs(ponturi_folder, exist_ok=True)
 
     # Get the absolute path for the template file
+    base_dir = os.path.dirname(os.path.abspath(__file__))
     template_file_path = os.path.join(base_dir, "..", template_file)
 
     try:
@@ -33,7 +47,7 @@ def create_tip_file(match, action, sport):
             template_content = f.read()
     except Exception as e:
         logger.error("Failed to read template file %s: %s", template_file_path, e)
-        return
+        return None
 
     filled_content = template_content.format(
         team1=match['team1'],
@@ -42,15 +56,26 @@ def create_tip_file(match, action, sport):
         commence_time=match['commence_time']
     )
 
-    sanitized_team1 = sanitize_filename(match['team1'])
-    sanitized_team2 = sanitize_filename(match['team2'])
-    filename = f"tip_{sanitized_team1}_vs_{sanitized_team2}.txt"
-    filepath = os.path.join(ponturi_folder, filename)
+    filepath = get_tip_file_path(match, sport)
 
     try:
+        # Tip files are read-only; make an existing one writable before overwriting it
+        if os.path.exists(filepath):
+            os.chmod(filepath, stat.S_IREAD | stat.S_IWRITE)
         with open(filepath, 'w') as f:
             f.write(filled_content.strip())
         os.chmod(filepath, stat.S_IREAD)
         logger.info("Tip file created: %s", filepath)
+        return filepath
     except Exception as e:
         logger.error("Failed to create tip file: %s", e)
+        return None
+
+def delete_tip_file(filepath):
+    try:
+        os.remove(filepath)
+        logger.info("Tip file deleted: %s", filepath)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error("Failed to delete tip file %s: %s", filepath, e)
@@ -0,0 +1,157 @@
+import os
+import json
+import hashlib
+import logging
+from constants import INCREMENTAL_STATE_FOLDER
+from utils.match_processing import get_matches_for_days, decide_action, format_match
+from utils.file_operations import create_tip_file, delete_tip_file
+
+logger = logging.getLogger(__name__)
+
+def get_match_key(match):
+    """
+    Stable key for a match: TheOddsAPI id, or league + teams + kickoff when the id is missing.
+    """
+    if match.get("id"):
+        return match["id"]
+    return f"{match['league']}|{match['team1']}|{match['team2']}|{match['commence_time']}"
+
+def compute_fingerprint(match, action):
+    """
+    Hashes everything that ends up in the output block and tip file:
+    the compact odds, the kickoff, the teams and the decision.
+    """
+    payload = json.dumps([
+        match["league"],
+        match["team1"],
+        match["team2"],
+        match["commence_time"],
+        match["odds"][match["team1"]],
+        match["odds"][match["team2"]],
+        match["odds"]["Draw"],
+        action
+    ], ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+def get_state_file(sport, state_folder=INCREMENTAL_STATE_FOLDER):
+    return os.path.join(state_folder, f"{sport}.json")
+
+def load_state(state_file):
+    """
+    Loads the per-match state of the previous incremental run. Returns an empty state
+    if there is none or it cannot be read, which makes the run a full recompute.
+    """
+    try:
+        with open(state_file, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        logger.info("No incremental state found at %s; doing a full run", state_file)
+        return {}
+    except Exception as e:
+        logger.error("Error reading incremental state %s: %s", state_file, e)
+        return {}
+
+def save_state(state, state_file):
+    try:
+        os.makedirs(os.path.dirname(state_file), exist_ok=True)
+        tmp_file = state_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_file, state_file)
+        logger.info("Incremental state saved to %s", state_file)
+    except Exception as e:
+        logger.error("Error saving incremental state %s: %s", state_file, e)
+
+def run_incremental(matches, top_n, header, sport, output_file, threshold=1.0, state_file=None):
+    """
+    Incremental counterpart of the main pipeline for an already scored list of matches.
+
+    Only matches whose fingerprint changed since the previous run are re-rendered and get
+    their tip file rewritten. Tip files of matches that left the window, or are no longer
+    safe bets, are deleted. The output file is rewritten in the same format as a full run.
+    """
+    if state_file is None:
+        state_file = get_state_file(sport)
+    old_state = load_state(state_file)
+    new_state = {}
+
+    if top_n == -1:
+        top_n = len(matches)
+    predictable_matches = sorted(matches, key=lambda m: m["predictability"])[:top_n]
+    sorted_matches = sorted(matches, key=lambda m: m["commence_time"])[:top_n]
+    tip_keys = {get_match_key(m) for m in predictable_matches}
+
+    changed = 0
+    stale_tip_files = []
+    for match in matches:
+        key = get_match_key(match)
+        action = decide_action(match, threshold=threshold)
+        fingerprint = compute_fingerprint(match, action)
+        entry = old_state.get(key) or {"fingerprint": None, "tip_file": None, "tip_fingerprint": None}
+
+        if entry["fingerprint"] != fingerprint:
+            changed += 1
+            entry["fingerprint"] = fingerprint
+            entry["block"] = format_match(match, action)
+
+        wants_tip = key in tip_keys and action.lower() == "pariu sigur"
+        if wants_tip:
+            tip_file = entry["tip_file"]
+            if entry["tip_fingerprint"] != fingerprint or not tip_file or not os.path.exists(tip_file):
+                tip_file = create_tip_file(match, action, sport)
+            entry["tip_file"] = tip_file
+            entry["tip_fingerprint"] = fingerprint if tip_file else None
+        elif entry["tip_file"]:
+            stale_tip_files.append(entry["tip_file"])
+            entry["tip_file"] = None
+            entry["tip_fingerprint"] = None
+
+        new_state[key] = entry
+
+    # Matches that are no longer in the window
+    removed = 0
+    for key, entry in old_state.items():
+        if key in new_state:
+            continue
+        removed += 1
+        if entry.get("tip_file"):
+            stale_tip_files.append(entry["tip_file"])
+
+    # Tip paths only depend on the team names, so skip paths a current match
+    # (e.g. a fixture re-issued under a new id) has just written
+    tip_files_in_use = {entry["tip_file"] for entry in new_state.values() if entry["tip_file"]}
+    for tip_file in set(stale_tip_files) - tip_files_in_use:
+        delete_tip_file(tip_file)
+
+    lines = [header, "Sorted by confidence level:\n"]
+    lines += [new_state[get_match_key(m)]["block"] + "\n\n" for m in predictable_matches]
+    lines.append("\nSorted by time of play:\n")
+    lines += [new_state[get_match_key(m)]["block"] + "\n\n" for m in sorted_matches]
+    try:
+        tmp_file = output_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            f.write("".join(lines))
+        os.replace(tmp_file, output_file)
+        logger.info("Match details written to %s", output_file)
+    except Exception as e:
+        logger.error("Failed to write match details to %s: %s", output_file, e)
+
+    save_state(new_state, state_file)
+    logger.info("Incremental run: %d matches, %d changed, %d removed", len(matches), changed, removed)
+
+def refresh_incremental(leagues, sport, nr_zile, top_n, output_file, get_api_data, get_cached_data, threshold=1.0):
+    """
+    Loads and scores the matches of the given leagues, then runs the incremental pipeline.
+    """
+    matches = get_matches_for_days(
+        nr_zile=nr_zile,
+        leagues=leagues,
+        get_api_data=get_api_data,
+        get_cached_data=get_cached_data
+    )
+    if not matches:
+        # Like the full pipeline, leave the previous output, tip files and state untouched
+        logger.info("No matches found for the specified interval or data is unavailable.")
+        return
+    header = f"Matches in the next {nr_zile} days from leagues: {', '.join(leagues)}\n"
+    run_incremental(matches, top_n, header, sport, output_file, threshold=threshold)
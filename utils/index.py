@@ -0,0 +1,139 @@
+import os
+import bisect
+import datetime
+import heapq
+import json
+import logging
+from constants import CACHE_FOLDER
+from utils.cache import get_sport_folder
+from utils.match_processing import build_match_entry, compute_predictability, decide_action
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_PREFIX = "api_response_"
+CACHE_FILE_SUFFIX = ".json"
+
+
+def parse_commence_time(commence_time):
+    """
+    Converts an ISO commence_time (e.g. "2026-01-30T19:30:00Z") into a UTC timestamp.
+    """
+    return datetime.datetime.fromisoformat(commence_time.replace("Z", "+00:00")).timestamp()
+
+
+class MatchIndex:
+    """
+    Immutable, in-memory snapshot of scored matches.
+
+    Matches are bucketed by sport, by (sport, league) and globally; every bucket is
+    kept sorted by kickoff so time windows are resolved with a binary search.
+    Safe bets get their own buckets so "safe only" queries never scan risky matches.
+    """
+
+    def __init__(self, matches, threshold=1.0):
+        self.threshold = threshold
+        self.built_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        self.size = len(matches)
+
+        buckets = {}
+        for match in sorted(matches, key=lambda m: m["kickoff"]):
+            safe = match["action"].lower() == "pariu sigur"
+            keys = [(None, None), (match["sport"], None), (match["sport"], match["league"])]
+            for key in keys:
+                buckets.setdefault((key, False), []).append(match)
+                if safe:
+                    buckets.setdefault((key, True), []).append(match)
+
+        # Freeze the buckets together with their kickoff keys for bisect
+        self._buckets = {
+            key: (tuple(m["kickoff"] for m in bucket), tuple(bucket))
+            for key, bucket in buckets.items()
+        }
+
+    def query(self, sport=None, league=None, hours=None, safe_only=False, top_n=-1, by="predictability", now=None):
+        """
+        Returns the matches kicking off in [now, now + hours), optionally restricted to a
+        sport and/or league and to safe bets, sorted by predictability or commence_time.
+        A negative top_n returns every match in the window.
+        """
+        if league is not None and sport is None:
+            sport = get_sport_folder(league)
+        bucket = self._buckets.get(((sport, league), bool(safe_only)))
+        if bucket is None:
+            return []
+        kickoffs, matches = bucket
+
+        if now is None:
+            now = datetime.datetime.now(datetime.timezone.utc).timestamp()
+        start = bisect.bisect_left(kickoffs, now)
+        end = len(kickoffs) if hours is None else bisect.bisect_left(kickoffs, now + hours * 3600)
+        window = matches[start:end]
+
+        if by == "commence_time":
+            return list(window if top_n < 0 else window[:top_n])
+        if top_n < 0:
+            return sorted(window, key=lambda m: m[by])
+        return heapq.nsmallest(top_n, window, key=lambda m: m[by])
+
+
+class IndexHolder:
+    """
+    Holds the current MatchIndex. Readers grab `current` once per request and keep
+    using that snapshot; refreshes build a whole new index and swap the reference,
+    so a reader never observes a partially built index.
+    """
+
+    def __init__(self, index=None):
+        self._index = index if index is not None else MatchIndex([])
+
+    @property
+    def current(self):
+        return self._index
+
+    def swap(self, index):
+        self._index = index
+        logger.info("Match index swapped in: %d matches (built at %s)", index.size, index.built_at)
+
+
+def list_cache_files(cache_folder=CACHE_FOLDER):
+    """
+    Lists (sport, league, path) for every compact cache file under cache_folder.
+    """
+    entries = []
+    if not os.path.isdir(cache_folder):
+        return entries
+    for sport in sorted(os.listdir(cache_folder)):
+        sport_folder = os.path.join(cache_folder, sport)
+        if not os.path.isdir(sport_folder):
+            continue
+        for name in sorted(os.listdir(sport_folder)):
+            if not (name.startswith(CACHE_FILE_PREFIX) and name.endswith(CACHE_FILE_SUFFIX)):
+                continue
+            league = name[len(CACHE_FILE_PREFIX):-len(CACHE_FILE_SUFFIX)]
+            entries.append((sport, league, os.path.join(sport_folder, name)))
+    return entries
+
+
+def build_index_from_cache(cache_folder=CACHE_FOLDER, threshold=1.0):
+    """
+    Loads every compact cache file, scores its matches and builds a new MatchIndex.
+    Raises if a cache file cannot be read, so callers can keep serving the old index.
+    """
+    matches = []
+    for sport, league, path in list_cache_files(cache_folder):
+        with open(path, "r") as f:
+            data = json.load(f)
+        for compact_match in data or []:
+            match = build_match_entry(league, compact_match)
+            if match is None:
+                continue
+            match["predictability"] = compute_predictability(match)
+            match["action"] = decide_action(match, threshold=threshold)
+            match["sport"] = sport
+            try:
+                match["kickoff"] = parse_commence_time(match["commence_time"])
+            except ValueError as e:
+                logger.error("Error converting date: %s", e)
+                continue
+            matches.append(match)
+    return MatchIndex(matches, threshold=threshold)
@@ -23,44 +23,59 @@ def get_matches_for_days(nr_zile=1, leagues=None, get_api_data=None, get_cached_
             continue
 
         for match in data:
-            team1 = match.get("home_team")
-            team2 = match.get("away_team")
-            if not team1 or not team2:
-                logger.warning("Match ignored; missing team information: %s", match)
+            match_entry = build_match_entry(league, match, today, end_date)
+            if match_entry is None:
                 continue
-
-            try:
-                commence_time = datetime.datetime.fromisoformat(match['commence_time'].replace("Z", "+00:00")).date()
-            except Exception as e:
-                logger.error("Error converting date: %s", e)
-                continue
-
-            if today <= commence_time < end_date:
-                odds_home = match.get("odds_home")
-                odds_away = match.get("odds_away")
-                odds_draw = match.get("odds_draw")
-
-                if not (isinstance(odds_home, (int, float)) and isinstance(odds_away, (int, float)) and isinstance(odds_draw, (int, float))):
-                    logger.warning("Match ignored; missing compact odds for: %s vs %s", team1, team2)
-                    continue
-
-                match_entry = {
-                    "league": league,
-                    "team1": team1,
-                    "team2": team2,
-                    "odds": {
-                        team1: float(odds_home),
-                        team2: float(odds_away),
-                        "Draw": float(odds_draw)
-                    },
-                    "commence_time": match["commence_time"]
-                }
-                combined_matches.append(match_entry)
-                logger.debug("Match added: %s", match_entry)
+            combined_matches.append(match_entry)
+            logger.debug("Match added: %s", match_entry)
     for match in combined_matches:
         match['predictability'] = compute_predictability(match)
     return combined_matches
 
+def build_match_entry(league, match, start_date=None, end_date=None):
+    """
+    Builds a match entry from a compact match of the given league.
+    Returns None if the match is incomplete or, when a date interval is given,
+    falls outside [start_date, end_date).
+    """
+    team1 = match.get("home_team")
+    team2 = match.get("away_team")
+    if not team1 or not team2:
+        logger.warning("Match ignored; missing team information: %s", match)
+        return None
+
+    try:
+        commence_time = datetime.datetime.fromisoformat(match['commence_time'].replace("Z", "+00:00")).date()
+    except Exception as e:
+        logger.error("Error converting date: %s", e)
+        return None
+
+    if start_date is not None and commence_time < start_date:
+        return None
+    if end_date is not None and commence_time >= end_date:
+        return None
+
+    odds_home = match.get("odds_home")
+    odds_away = match.get("odds_away")
+    odds_draw = match.get("odds_draw")
+
+    if not (isinstance(odds_home, (int, float)) and isinstance(odds_away, (int, float)) and isinstance(odds_draw, (int, float))):
+        logger.warning("Match ignored; missing compact odds for: %s vs %s", team1, team2)
+        return None
+
+    return {
+        "id": match.get("id"),
+        "league": league,
+        "team1": team1,
+        "team2": team2,
+        "odds": {
+            team1: float(odds_home),
+            team2: float(odds_away),
+            "Draw": float(odds_draw)
+        },
+        "commence_time": match["commence_time"]
+    }
+
 def compute_predictability(match):
     """
     Calculates the predictability score for a match:
@@ -99,9 +114,9 @@ def get_matches_sorted(by, nr_zile=1, top_n=-1, leagues=None, get_api_data=None,
         top_n = len(sorted_matches)
     return sorted_matches[:top_n]
 
-def print_match(match, action, output_file=None):
+def format_match(match, action):
     """
-    Prints match details to the terminal and optionally writes them to an output file.
+    Renders the match details block written to the output file.
     """
     # Convertim data din format ISO într-un format prietenos
     try:
@@ -128,7 +143,7 @@ def print_match(match, action, output_file=None):
         return f"|{label:<{label_width}}{str_value:>{value_width}}|"
 
     # Build the match details as a string
-    match_details = "\n".join([
+    return "\n".join([
         border,
         format_row("Liga:", match['league']),
         format_row("Echipe:", f"{match['team1']} vs {match['team2']}"),
@@ -138,6 +153,12 @@ def print_match(match, action, output_file=None):
         border
     ])
 
+def print_match(match, action, output_file=None):
+    """
+    Prints match details to the terminal and optionally writes them to an output file.
+    """
+    match_details = format_match(match, action)
+
     # Write to the output file
     if output_file:
         try:
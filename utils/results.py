@@ -0,0 +1,247 @@
+import os
+import re
+import json
+import datetime
+import logging
+import unicodedata
+from collections import defaultdict
+from constants import ARCHIVE_FOLDER, RESULTS_FILE
+from utils.cache import load_json, merge_json
+
+logger = logging.getLogger(__name__)
+
+OUTCOMES = ("1", "x", "2")
+ROW_PATTERN = re.compile(r"^\|Echipe:\s*(?P<display>.+?)\|\s*(?P<value>.*)$")
+NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+PICK_PATTERN = re.compile(r"^(?P<pick>[12xX])\s*->\s*(?P<confidence>\d+(?:\.\d+)?)%")
+TRUNCATION_MARKER = "..."
+
+def normalize_name(name):
+    """
+    Normalizes a team name or display string for matching: strips accents,
+    casefolds and collapses whitespace ("Atlético  Madrid" -> "atletico madrid").
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+def parse_source_date(source):
+    """
+    Extracts the analysis date from a manualanalysis file prefix, e.g.
+    "football20260130" or "ucl28Jan2026". Returns None if there is no date.
+    """
+    match = re.search(r"(\d{8})$", source)
+    if match:
+        return datetime.datetime.strptime(match.group(1), "%Y%m%d").date()
+    match = re.search(r"(\d{1,2}[A-Za-z]{3}\d{4})$", source)
+    if match:
+        return datetime.datetime.strptime(match.group(1).title(), "%d%b%Y").date()
+    return None
+
+def parse_analysis_file(path):
+    """
+    Parses a manualanalysis file into a list of (display, value) rows.
+    Lines that are not "|Echipe: ...|" rows (notes, ROI summaries) are ignored.
+    """
+    rows = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            row = ROW_PATTERN.match(line.rstrip("\n"))
+            if row:
+                rows.append((row.group("display").strip(), row.group("value").strip()))
+    return rows
+
+def pick_from_probabilities(probabilities):
+    return OUTCOMES[max(range(3), key=lambda i: probabilities[i])]
+
+def pick_from_odds(odds):
+    return OUTCOMES[min(range(3), key=lambda i: odds[i])]
+
+def parse_model_pick(value):
+    """
+    Parses a model column, either "52.7% - 26.0% - 21.3%" (1/x/2 probabilities)
+    or the older "2 -> 56.0% OK" (pick and its probability). Returns None if empty.
+    """
+    pick = PICK_PATTERN.match(value)
+    if pick:
+        return {"pick": pick.group("pick").lower(), "probability": float(pick.group("confidence"))}
+    numbers = [float(n) for n in NUMBER_PATTERN.findall(value)]
+    if len(numbers) == 3:
+        pick = pick_from_probabilities(numbers)
+        return {"pick": pick, "probability": numbers[OUTCOMES.index(pick)], "probabilities": numbers}
+    return None
+
+def group_analysis_files(folder):
+    """
+    Groups manualanalysis files by source prefix (case-insensitive), e.g.
+    {"ucl28jan2026": {"res": path, "gpt": path, "med": path, ...}}.
+    """
+    groups = defaultdict(dict)
+    for name in sorted(os.listdir(folder)):
+        base, ext = os.path.splitext(name)
+        if ext != ".txt" or "_" not in base:
+            continue
+        source, kind = base.rsplit("_", 1)
+        groups[source.lower()][kind.lower()] = os.path.join(folder, name)
+    return groups
+
+class MatchIdIndex:
+    """
+    Resolves "|Echipe: team1 vs team2|" display strings back to TheOddsAPI match ids.
+
+    Matches from the compact archive are bucketed by kickoff date and keyed by the
+    normalized "team1 vs team2" string, so a full name is a dict lookup and a
+    truncated one ("... vs Tottenham Ho...") only scans the matches of that day.
+    """
+
+    def __init__(self, compact_matches):
+        self.by_date = defaultdict(dict)
+        self.matches = {}
+        for match in compact_matches:
+            try:
+                kickoff = datetime.datetime.fromisoformat(match["commence_time"].replace("Z", "+00:00")).date()
+                display = normalize_name(f"{match['home_team']} vs {match['away_team']}")
+            except Exception as e:
+                logger.warning("Archived match ignored; cannot index %s: %s", match.get("id"), e)
+                continue
+            self.by_date[kickoff].setdefault(display, []).append(match["id"])
+            self.matches[match["id"]] = match
+
+    def _candidates(self, display, date):
+        bucket = self.by_date.get(date, {})
+        if display.endswith(TRUNCATION_MARKER):
+            prefix = normalize_name(display[:-len(TRUNCATION_MARKER)])
+            return [match_id for key, ids in bucket.items() if key.startswith(prefix) for match_id in ids]
+        return list(bucket.get(normalize_name(display), []))
+
+    def resolve(self, display, date, window_days=1):
+        """
+        Returns the match id for a display string analysed on `date`, looking at kickoffs
+        on that day first and then up to `window_days` later or earlier.
+        Returns None if no match, or more than one match, is found.
+        """
+        offsets = [0]
+        for delta in range(1, window_days + 1):
+            offsets += [delta, -delta]
+        for offset in offsets:
+            candidates = self._candidates(display, date + datetime.timedelta(days=offset))
+            if len(candidates) == 1:
+                return candidates[0]
+            if len(candidates) > 1:
+                logger.warning("Ambiguous match %s on %s: %s", display, date, candidates)
+                return None
+        return None
+
+def build_match_id_index(archive_folder=ARCHIVE_FOLDER):
+    """
+    Builds a MatchIdIndex from every compact archive file, across all sports.
+    """
+    compact_matches = []
+    if os.path.isdir(archive_folder):
+        for sport in sorted(os.listdir(archive_folder)):
+            sport_folder = os.path.join(archive_folder, sport)
+            if not os.path.isdir(sport_folder):
+                continue
+            for name in sorted(os.listdir(sport_folder)):
+                if name.endswith(".json"):
+                    compact_matches.extend(load_json(os.path.join(sport_folder, name)))
+    else:
+        logger.warning("Archive folder not found: %s", archive_folder)
+    logger.info("Match id index built from %d archived matches", len(compact_matches))
+    return MatchIdIndex(compact_matches)
+
+def ingest_source(source, files, index, window_days=1):
+    """
+    Parses all files of one analysis source and returns (rows, unresolved), where rows
+    are results-table entries keyed by match id and unresolved lists display strings
+    that could not be joined to the archive.
+    """
+    date = parse_source_date(source)
+    if date is None:
+        logger.warning("Cannot determine date for %s; skipping", source)
+        return [], []
+
+    entries = {}
+    unresolved = []
+    ids = {}
+    for kind, path in sorted(files.items()):
+        for display, value in parse_analysis_file(path):
+            if display not in ids:
+                ids[display] = index.resolve(display, date, window_days)
+                if ids[display] is None:
+                    unresolved.append(display)
+            match_id = ids[display]
+            if match_id is None:
+                continue
+
+            match = index.matches[match_id]
+            entry = entries.setdefault(match_id, {
+                "id": match_id,
+                "league": match.get("sport_key"),
+                "commence_time": match.get("commence_time"),
+                "home_team": match.get("home_team"),
+                "away_team": match.get("away_team"),
+                "source": source,
+                "result": None,
+                "odds": None,
+                "picks": {}
+            })
+
+            if kind == "res":
+                result = value.lower()
+                entry["result"] = result if result in OUTCOMES else None
+            elif kind == "odd":
+                odds = [float(n) for n in NUMBER_PATTERN.findall(value)]
+                entry["odds"] = odds if len(odds) == 3 else None
+            else:
+                pick = parse_model_pick(value)
+                if pick:
+                    entry["picks"][kind] = pick
+    return list(entries.values()), unresolved
+
+def ingest_folder(folder, index, window_days=1):
+    """
+    Ingests every analysis source in `folder`. Returns (rows, unresolved) where
+    unresolved maps each source to the display strings that were not joined.
+    """
+    rows = []
+    unresolved = {}
+    for source, files in group_analysis_files(folder).items():
+        source_rows, source_unresolved = ingest_source(source, files, index, window_days)
+        rows.extend(source_rows)
+        if source_unresolved:
+            unresolved[source] = source_unresolved
+        logger.info("Ingested %s: %d matches, %d unresolved", source, len(source_rows), len(source_unresolved))
+    return rows, unresolved
+
+def save_results(rows, results_file=RESULTS_FILE):
+    """
+    Merges rows into the results table (keyed by match id) and saves it.
+    """
+    merged = merge_json(load_json(results_file) if os.path.exists(results_file) else [], rows)
+    merged.sort(key=lambda r: (r.get("commence_time") or "", r["id"]))
+    os.makedirs(os.path.dirname(results_file) or ".", exist_ok=True)
+    tmp_file = results_file + ".tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(merged, f, ensure_ascii=False)
+    os.replace(tmp_file, results_file)
+    logger.info("Results table saved to %s (%d matches)", results_file, len(merged))
+    return merged
+
+def evaluate_picks(rows):
+    """
+    Computes accuracy per model over rows with a known result. The market favourite
+    (lowest odds) is reported as "market". Returns {model: (correct, total)}.
+    """
+    scores = defaultdict(lambda: [0, 0])
+    for row in rows:
+        result = row.get("result")
+        if result not in OUTCOMES:
+            continue
+        picks = {model: pick["pick"] for model, pick in row.get("picks", {}).items()}
+        if row.get("odds"):
+            picks["market"] = pick_from_odds(row["odds"])
+        for model, pick in picks.items():
+            scores[model][0] += pick == result
+            scores[model][1] += 1
+    return {model: tuple(score) for model, score in sorted(scores.items())}
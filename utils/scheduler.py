@@ -0,0 +1,160 @@
+import os
+import json
+import datetime
+import logging
+from constants import SCHEDULE_FILE
+
+logger = logging.getLogger(__name__)
+
+# (time left until the nearest kickoff, refresh interval), checked in order
+POLL_INTERVALS = [
+    (datetime.timedelta(hours=1), datetime.timedelta(minutes=15)),
+    (datetime.timedelta(hours=6), datetime.timedelta(hours=1)),
+    (datetime.timedelta(hours=24), datetime.timedelta(hours=3)),
+    (datetime.timedelta(hours=72), datetime.timedelta(hours=12)),
+]
+# Refresh interval for leagues with no upcoming match in the cache
+IDLE_INTERVAL = datetime.timedelta(hours=24)
+# Window over which the credit budget is enforced
+BUDGET_WINDOW = datetime.timedelta(hours=24)
+
+def utc_now():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+def parse_time(value):
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+def nearest_kickoff(compact_matches, now):
+    """
+    Returns the earliest commence_time that is still in the future, or None.
+    """
+    kickoffs = []
+    for match in compact_matches or []:
+        try:
+            kickoff = parse_time(match["commence_time"])
+        except Exception as e:
+            logger.error("Error converting date: %s", e)
+            continue
+        if kickoff >= now:
+            kickoffs.append(kickoff)
+    return min(kickoffs) if kickoffs else None
+
+def compute_poll_interval(kickoff, now):
+    """
+    Picks the refresh interval from how far away the nearest kickoff is.
+    """
+    if kickoff is None:
+        return IDLE_INTERVAL
+    time_left = kickoff - now
+    for max_time_left, interval in POLL_INTERVALS:
+        if time_left <= max_time_left:
+            return interval
+    return IDLE_INTERVAL
+
+def load_schedule(schedule_file=SCHEDULE_FILE):
+    """
+    Loads the persisted schedule. Returns an empty schedule if there is none,
+    which makes every league due on the first cycle.
+    """
+    try:
+        with open(schedule_file, "r") as f:
+            schedule = json.load(f)
+        logger.info("Schedule loaded from %s", schedule_file)
+    except FileNotFoundError:
+        logger.info("No schedule found at %s; every league is due", schedule_file)
+        schedule = {}
+    except Exception as e:
+        logger.error("Error reading schedule %s: %s", schedule_file, e)
+        schedule = {}
+    schedule.setdefault("leagues", {})
+    schedule.setdefault("fetches", [])
+    return schedule
+
+def save_schedule(schedule, schedule_file=SCHEDULE_FILE):
+    try:
+        os.makedirs(os.path.dirname(schedule_file) or ".", exist_ok=True)
+        tmp_file = schedule_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(schedule, f, indent=2)
+        os.replace(tmp_file, schedule_file)
+        logger.info("Schedule saved to %s", schedule_file)
+    except Exception as e:
+        logger.error("Error saving schedule %s: %s", schedule_file, e)
+
+def credits_left(schedule, budget, now):
+    """
+    Drops fetches older than the budget window and returns the credits still available.
+    Each league fetch costs one credit (one region, one market).
+    """
+    schedule["fetches"] = [t for t in schedule["fetches"] if now - parse_time(t) < BUDGET_WINDOW]
+    return max(budget - len(schedule["fetches"]), 0)
+
+def update_league(schedule, league, compact_matches, now, refreshed):
+    """
+    Recomputes a league's nearest kickoff and next refresh time from its compact matches.
+    """
+    entry = schedule["leagues"].setdefault(league, {})
+    kickoff = nearest_kickoff(compact_matches, now)
+    if refreshed:
+        entry["last_refresh"] = now.isoformat()
+    last_refresh = parse_time(entry["last_refresh"]) if entry.get("last_refresh") else None
+    entry["nearest_kickoff"] = kickoff.isoformat() if kickoff else None
+    entry["next_refresh"] = (last_refresh + compute_poll_interval(kickoff, now)).isoformat() if last_refresh else now.isoformat()
+
+def get_due_leagues(schedule, leagues, now):
+    """
+    Returns the leagues whose next refresh is due, most urgent (nearest kickoff) first.
+    """
+    due = []
+    for league in leagues:
+        entry = schedule["leagues"].get(league, {})
+        next_refresh = entry.get("next_refresh")
+        if next_refresh is None or parse_time(next_refresh) <= now:
+            kickoff = entry.get("nearest_kickoff")
+            due.append((kickoff is None, kickoff or "", league))
+    return [league for _, _, league in sorted(due)]
+
+def run_cycle(schedule, leagues, budget, fetch_league, load_league, now=None):
+    """
+    Runs one fetch cycle: every due league is fetched in one batch, as far as the credit
+    budget allows; the rest stay due for the next cycle. Returns the fetched leagues.
+
+    fetch_league(league) calls the API and returns compact matches (or None on failure);
+    load_league(league) returns the cached compact matches without calling the API.
+    """
+    if now is None:
+        now = utc_now()
+    # Re-evaluate every league against the cache, so intervals shrink as kickoffs get closer
+    for league in leagues:
+        update_league(schedule, league, load_league(league), now, refreshed=False)
+
+    due = get_due_leagues(schedule, leagues, now)
+    available = credits_left(schedule, budget, now)
+    if len(due) > available:
+        logger.warning("Credit budget reached: fetching %d of %d due leagues, deferring %s", available, len(due), due[available:])
+    fetched = []
+    for league in due[:available]:
+        data = fetch_league(league)
+        schedule["fetches"].append(now.isoformat())
+        if data is None:
+            # Back off like a normal refresh instead of retrying on every cycle
+            logger.error("Refresh failed for league %s", league)
+            update_league(schedule, league, load_league(league), now, refreshed=True)
+            continue
+        update_league(schedule, league, data, now, refreshed=True)
+        fetched.append(league)
+    logger.info("Fetch cycle done: %d due, %d fetched, %d credits left", len(due), len(fetched), credits_left(schedule, budget, now))
+    return fetched
+
+def next_wakeup(schedule, leagues, budget, now=None):
+    """
+    Returns when the next cycle should run: the earliest next refresh, or, if the
+    budget is spent, the moment the oldest fetch drops out of the budget window.
+    """
+    if now is None:
+        now = utc_now()
+    refreshes = [parse_time(schedule["leagues"][league]["next_refresh"]) for league in leagues if schedule["leagues"].get(league, {}).get("next_refresh")]
+    wakeup = min(refreshes) if refreshes else now + IDLE_INTERVAL
+    if credits_left(schedule, budget, now) == 0 and schedule["fetches"]:
+        wakeup = max(wakeup, min(parse_time(t) for t in schedule["fetches"]) + BUDGET_WINDOW)
+    return wakeup